@@ -6,9 +6,7 @@ from os.path import join, expanduser
 from hdx.api.configuration import Configuration
 from hdx.facades.keyword_arguments import facade
 from hdx.scraper.outputs.base import BaseOutput
-from hdx.scraper.outputs.excelfile import ExcelFile
 from hdx.scraper.outputs.googlesheets import GoogleSheets
-from hdx.scraper.outputs.json import JsonFile
 from hdx.scraper.utilities import string_params_to_dict
 from hdx.scraper.utilities.reader import Read
 from hdx.utilities.dateparse import now_utc
@@ -16,6 +14,8 @@ from hdx.utilities.easy_logging import setup_logging
 from hdx.utilities.errors_onexit import ErrorsOnExit
 from hdx.utilities.path import temp_dir
 from scrapers.main import get_indicators
+from scrapers.utilities.outputs import FastJsonFile, StreamingExcelFile
+from scrapers.utilities.reader import RATE_LIMIT, CachedRead
 
 setup_logging()
 logger = logging.getLogger()
@@ -86,7 +86,16 @@ def parse_args():
         action="store_true",
         help="Use saved data",
     )
+    parser.add_argument(
+        "-ct",
+        "--cache_ttl",
+        default=None,
+        type=float,
+        help="Reuse saved data up to this many hours old",
+    )
     args = parser.parse_args()
+    if args.cache_ttl and (args.save or args.use_saved):
+        parser.error("--cache_ttl cannot be combined with --save or --use_saved")
     return args
 
 
@@ -103,6 +112,7 @@ def main(
     countries_override,
     save,
     use_saved,
+    cache_ttl,
     **ignore,
 ):
     logger.info(f"##### {lookup} version {VERSION:.1f} ####")
@@ -110,17 +120,26 @@ def main(
     with ErrorsOnExit() as errors_on_exit:
         with temp_dir() as temp_folder:
             today = now_utc()
-            Read.create_readers(
+            if cache_ttl:
+                logger.info(f"Using saved data up to {cache_ttl} hours old")
+                reader_class = CachedRead
+                reader_kwargs = {"cache_ttl": cache_ttl * 3600}
+            else:
+                reader_class = Read
+                reader_kwargs = dict()
+            reader_class.create_readers(
                 temp_folder,
                 "saved_data",
                 temp_folder,
                 save,
                 use_saved,
+                rate_limit=RATE_LIMIT,
                 hdx_auth=configuration.get_api_key(),
                 header_auths=header_auths,
                 basic_auths=basic_auths,
                 param_auths=param_auths,
                 today=today,
+                **reader_kwargs,
             )
             if scrapers_to_run:
                 logger.info(f"Updating only scrapers: {scrapers_to_run}")
@@ -130,9 +149,10 @@ def main(
                 logger.info("Updating all tabs")
             else:
                 logger.info(f"Updating only these tabs: {updatetabs}")
+            updatetabs = set(updatetabs)
             noout = BaseOutput(updatetabs)
             if excel_path:
-                excelout = ExcelFile(excel_path, tabs, updatetabs)
+                excelout = StreamingExcelFile(excel_path, tabs, updatetabs)
             else:
                 excelout = noout
             if gsheet_auth:
@@ -148,7 +168,7 @@ def main(
             if nojson:
                 jsonout = noout
             else:
-                jsonout = JsonFile(configuration["json"], updatetabs)
+                jsonout = FastJsonFile(configuration["json"], updatetabs)
             outputs = {"gsheets": gsheets, "excel": excelout, "json": jsonout}
             countries_to_save = get_indicators(
                 configuration,
@@ -226,4 +246,5 @@ if __name__ == "__main__":
         countries_override=countries_override,
         save=args.save,
         use_saved=args.use_saved,
+        cache_ttl=args.cache_ttl,
     )
@@ -5,6 +5,8 @@ from dateutil.relativedelta import relativedelta
 from hdx.location.country import Country
 from hdx.scraper.base_scraper import BaseScraper
 
+from .utilities.reader import download_jsons
+
 logger = logging.getLogger(__name__)
 
 
@@ -83,9 +85,14 @@ class IPC(BaseScraper):
         projection_names = ["Current", "First Projection", "Second Projection"]
         projection_mappings = ["", "_projected", "_second_projected"]
         analysis_dates = set()
-        for countryiso3, countryiso2 in sorted(countryisos):
-            url = f"{base_url}/population?country={countryiso2}"
-            country_data = reader.download_json(url)
+        countryisos = sorted(countryisos)
+        urls = [
+            f"{base_url}/population?country={countryiso2}"
+            for _, countryiso2 in countryisos
+        ]
+        for (countryiso3, _), country_data in zip(
+            countryisos, download_jsons(reader, urls)
+        ):
             if country_data:
                 country_data = country_data[0]
             else:
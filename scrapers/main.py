@@ -2,22 +2,40 @@ import logging
 from os.path import join
 
 from hdx.location.adminlevel import AdminLevel
-from hdx.location.country import Country
-from hdx.scraper.runner import Runner
 from hdx.scraper.utilities.fallbacks import Fallbacks
 from hdx.scraper.utilities.region_lookup import RegionLookup
 from hdx.scraper.utilities.sources import Sources
-from hdx.scraper.utilities.writer import Writer
 
 from .fts import FTS
 from .inform import Inform
 from .iom_dtm import IOMDTM
 from .ipc import IPC
 from .unhcr import UNHCR
+from .utilities.country import load_countriesdata
+from .utilities.runner import ConcurrentRunner
+from .utilities.writer import FastWriter
 from .whowhatwhere import WhoWhatWhere
 
 logger = logging.getLogger(__name__)
 
+# level name, runner level and configuration key suffix of the configurable scrapers
+SCRAPER_LEVELS = (
+    ("national", "national", "_national"),
+    ("subnational", "subnational", "_subnational"),
+    ("allregions", "single", "_allregions"),
+)
+
+# configuration key, class and names of the keyword arguments (besides the
+# configuration) of the custom scrapers in the order they are added to the runner
+SCRAPER_SPECS = (
+    ("ipc", IPC, ("today", "countryiso3s", "adminone")),
+    ("fts", FTS, ("today", "outputs", "countryiso3s")),
+    ("unhcr", UNHCR, ("today", "countryiso3s")),
+    ("inform", Inform, ("today", "countryiso3s")),
+    ("whowhatwhere", WhoWhatWhere, ("today", "adminone")),
+    ("iom_dtm", IOMDTM, ("today", "adminone")),
+)
+
 
 def get_indicators(
     configuration,
@@ -30,10 +48,15 @@ def get_indicators(
     use_live=True,
     fallbacks_root="",
 ):
-    Country.countriesdata(
-        use_live=use_live,
-        country_name_overrides=configuration["country_name_overrides"],
-        country_name_mappings=configuration["country_name_mappings"],
+    tabs = set(tabs)
+    scraper_configurations = {
+        level_name: configuration[f"scraper{suffix}"]
+        for level_name, _, suffix in SCRAPER_LEVELS
+    }
+    load_countriesdata(
+        use_live,
+        configuration["country_name_overrides"],
+        configuration["country_name_mappings"],
     )
 
     if countries_override:
@@ -60,56 +83,46 @@ def get_indicators(
             sources_key="sources_data",
         )
     Sources.set_default_source_date_format("%Y-%m-%d")
-    runner = Runner(
+    runner = ConcurrentRunner(
         countries,
         today,
         errors_on_exit=errors_on_exit,
         scrapers_to_run=scrapers_to_run,
     )
     configurable_scrapers = dict()
-    for level_name in "national", "subnational", "allregions":
-        if level_name == "allregions":
-            level = "single"
-        else:
-            level = level_name
-        suffix = f"_{level_name}"
+    for level_name, level, suffix in SCRAPER_LEVELS:
         configurable_scrapers[level_name] = runner.add_configurables(
-            configuration[f"scraper{suffix}"],
+            scraper_configurations[level_name],
             level,
             adminlevel=adminlevel,
             level_name=level_name,
             suffix=suffix,
         )
-    ipc = IPC(configuration["ipc"], today, countries, adminlevel)
-
-    fts = FTS(configuration["fts"], today, outputs, countries)
-    unhcr = UNHCR(configuration["unhcr"], today, countries)
-    inform = Inform(configuration["inform"], today, countries)
     national_names = configurable_scrapers["national"] + [
         "fts",
         "unhcr",
         "inform",
         "ipc",
     ]
-
-    whowhatwhere = WhoWhatWhere(configuration["whowhatwhere"], today, adminlevel)
-    iomdtm = IOMDTM(configuration["iom_dtm"], today, adminlevel)
-
     subnational_names = configurable_scrapers["subnational"] + [
         "whowhatwhere",
         "iom_dtm",
     ]
     subnational_names.insert(1, "ipc")
 
+    scraper_args = {
+        "today": today,
+        "outputs": outputs,
+        "countryiso3s": countries,
+        "adminone": adminlevel,
+    }
     runner.add_customs(
-        (
-            ipc,
-            fts,
-            unhcr,
-            inform,
-            whowhatwhere,
-            iomdtm,
-        )
+        [
+            scraper_class(
+                configuration[name], **{key: scraper_args[key] for key in keys}
+            )
+            for name, scraper_class, keys in SCRAPER_SPECS
+        ]
     )
 
     regional_names = runner.add_aggregators(
@@ -129,7 +142,7 @@ def get_indicators(
         )
     )
 
-    writer = Writer(runner, outputs)
+    writer = FastWriter(runner, outputs)
     if "national" in tabs:
         flag_countries = {
             "header": "ishrp",
@@ -153,7 +166,11 @@ def get_indicators(
         )
     if "allregions" in tabs:
         allregions_names = configurable_scrapers["allregions"]
-        allregions_rows = writer.get_toplevel_rows(names=allregions_names)
+        # no allregions scrapers configured (falsy names would mean all scrapers)
+        if allregions_names:
+            allregions_rows = writer.get_toplevel_rows(names=allregions_names)
+        else:
+            allregions_rows = None
         writer.update_toplevel(
             allregions_rows,
             regional_rows=regional_rows,
@@ -5,6 +5,8 @@ from dateutil.relativedelta import relativedelta
 from hdx.scraper.base_scraper import BaseScraper
 from hdx.utilities.dateparse import parse_date
 
+from .utilities.reader import download_jsons
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +34,8 @@ class UNHCR(BaseScraper):
         population_collections = self.datasetinfo["population_collections"]
         exclude = self.datasetinfo["exclude"]
         valuedicts = self.get_values("national")
+        countryiso3s = list()
+        urls = list()
         for countryiso3 in self.countryiso3s:
             if countryiso3 in exclude:
                 continue
@@ -40,19 +44,20 @@ class UNHCR(BaseScraper):
                 continue
             for population_collection in population_collections:
                 url = base_url % (population_collection, code)
-                logger.info(f"Downloading {url}")
-                json = reader.download_json(url)
-                data = json["data"][0]
-                individuals = data["individuals"]
-                if individuals is None:
-                    continue
-                date = data["date"]
-                if parse_date(date) < self.today - relativedelta(years=2):
-                    continue
-                existing_individuals = valuedicts[0].get(countryiso3)
-                if existing_individuals is None:
-                    valuedicts[0][countryiso3] = int(individuals)
-                    valuedicts[1][countryiso3] = date
-                else:
-                    valuedicts[0][countryiso3] += int(individuals)
+                countryiso3s.append(countryiso3)
+                urls.append(url)
+        for countryiso3, json in zip(countryiso3s, download_jsons(reader, urls)):
+            data = json["data"][0]
+            individuals = data["individuals"]
+            if individuals is None:
+                continue
+            date = data["date"]
+            if parse_date(date) < self.today - relativedelta(years=2):
+                continue
+            existing_individuals = valuedicts[0].get(countryiso3)
+            if existing_individuals is None:
+                valuedicts[0][countryiso3] = int(individuals)
+                valuedicts[1][countryiso3] = date
+            else:
+                valuedicts[0][countryiso3] += int(individuals)
         self.datasetinfo["source_date"] = self.today
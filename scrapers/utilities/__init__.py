@@ -1,5 +1,11 @@
 from hdx.utilities.text import get_fraction_str
 
+CACHE_TTL = 86400  # seconds
+
+
+def identity(value):
+    return value
+
 
 def calculate_ratios(ratios, items_per_country, affected_items_per_country):
     for countryiso in items_per_country:
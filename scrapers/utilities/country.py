@@ -0,0 +1,92 @@
+import hashlib
+import json
+import logging
+import pickle
+from os import makedirs, remove, replace
+from os.path import exists, expanduser, getmtime, join
+from tempfile import mkstemp
+from time import time
+
+import hxl
+from hdx.location import __version__
+from hdx.location.country import Country
+from hxl import InputOptions
+
+from . import CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = join(expanduser("~"), ".cache", "hdx-scraper-arableague-viz")
+
+
+def read_cache(path, cache_ttl):
+    try:
+        if time() - getmtime(path) >= cache_ttl:
+            return None
+        with open(path, "rb") as f:
+            countriesdata = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:  # eg. truncated or from an incompatible version
+        logger.exception(f"Ignoring unreadable cached countries data in {path}!")
+        return None
+    logger.info(f"Using cached countries data in {path}")
+    return countriesdata
+
+
+def write_cache(path, cache_dir, countriesdata):
+    temp_path = None
+    try:
+        makedirs(cache_dir, exist_ok=True)
+        # written under a temporary name so other runs never see a partial file
+        fd, temp_path = mkstemp(suffix=".part", dir=cache_dir)
+        with open(fd, "wb") as f:
+            pickle.dump(countriesdata, f)
+        replace(temp_path, path)
+    except OSError:
+        logger.exception(f"Could not cache countries data in {path}!")
+    finally:
+        if temp_path and exists(temp_path):
+            remove(temp_path)
+
+
+def load_countriesdata(
+    use_live,
+    country_name_overrides,
+    country_name_mappings,
+    cache_dir=CACHE_DIR,
+    cache_ttl=CACHE_TTL,
+):
+    # Only the live feed involves a download and Country keeps whatever it has
+    # loaded for the rest of the process
+    if not use_live or Country._countriesdata is not None:
+        return Country.countriesdata(
+            use_live=use_live,
+            country_name_overrides=country_name_overrides,
+            country_name_mappings=country_name_mappings,
+        )
+    key = json.dumps(
+        (__version__, Country._ochaurl, country_name_overrides, country_name_mappings),
+        sort_keys=True,
+    )
+    filename = f"countries-{hashlib.sha1(key.encode()).hexdigest()}.pkl"
+    path = join(cache_dir, filename)
+    if country_name_overrides is not None:
+        Country.set_country_name_overrides(country_name_overrides)
+    if country_name_mappings is not None:
+        Country.set_country_name_mappings(country_name_mappings)
+    countriesdata = read_cache(path, cache_ttl)
+    if countriesdata is not None:
+        Country._countriesdata = countriesdata
+        return countriesdata
+    try:
+        countries = hxl.data(Country._ochaurl, InputOptions(encoding="utf-8"))
+        Country.set_countriesdata(countries)
+    except OSError:
+        # Country falls back to the file in its package which is not cached so
+        # that the live feed is tried again next time
+        logger.exception("Download from OCHA feed failed! Not caching countries data.")
+        Country._countriesdata = None
+        return Country.countriesdata(use_live=False)
+    write_cache(path, cache_dir, Country._countriesdata)
+    return Country._countriesdata
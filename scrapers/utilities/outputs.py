@@ -0,0 +1,72 @@
+import logging
+from os.path import join
+
+import orjson
+import xlsxwriter
+from hdx.scraper.outputs.base import BaseOutput
+from hdx.scraper.outputs.json import JsonFile
+
+logger = logging.getLogger(__name__)
+
+
+class FastJsonFile(JsonFile):
+    def save(self, folder=None, **kwargs):
+        # additional outputs are filtered subsets that the parent class builds
+        if self.configuration.get("additional_outputs"):
+            return super().save(folder=folder, **kwargs)
+        filepath = self.configuration["output"]
+        if folder:
+            filepath = join(folder, filepath)
+        logger.info(f"Writing JSON to {filepath}")
+        with open(filepath, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    self.json,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+        return [filepath]
+
+
+class StreamingExcelFile(BaseOutput):
+    # Like ExcelFile but tabs are kept until save and then written row by row by
+    # xlsxwriter, which flushes each row to disk rather than building the
+    # workbook in memory
+    def __init__(self, excel_path, tabs, updatetabs):
+        super().__init__(updatetabs)
+        self.excel_path = excel_path
+        self.tabs = tabs
+        self.tab_values = dict()
+
+    def update_tab(self, tabname, values, hxltags=None):
+        if tabname not in self.updatetabs:
+            return
+        # as with ExcelFile, an updated tab is replaced and moved to the end
+        self.tab_values.pop(tabname, None)
+        self.tab_values[tabname] = (values, hxltags)
+
+    def save(self):
+        workbook = xlsxwriter.Workbook(
+            self.excel_path,
+            {
+                "constant_memory": True,
+                "strings_to_formulas": False,
+                "strings_to_urls": False,
+                "nan_inf_to_errors": True,
+                # ExcelFile (openpyxl) writes dates with a date format too
+                "default_date_format": "yyyy-mm-dd",
+            },
+        )
+        for tabname, (values, hxltags) in self.tab_values.items():
+            tab = workbook.add_worksheet(self.tabs[tabname])
+            if isinstance(values, list):
+                rows = values
+            else:
+                headers = list(values.columns.values)
+                rows = [headers]
+                if hxltags:
+                    rows.append([hxltags.get(header, "") for header in headers])
+                rows.extend(values.itertuples(index=False, name=None))
+            for i, row in enumerate(rows):
+                tab.write_row(i, 0, row)
+        workbook.close()
@@ -0,0 +1,241 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from os import close, makedirs, remove, replace
+from os.path import dirname, exists, getmtime, join
+from shutil import move
+from tempfile import mkstemp
+from threading import local
+from time import time
+
+import orjson
+from hdx.data.dataset import Dataset
+from hdx.scraper.utilities.reader import Read
+from hdx.utilities.base_downloader import DownloadError
+from hdx.utilities.downloader import Download
+from hdx.utilities.loader import load_json, load_text, load_yaml
+from hdx.utilities.saver import save_json, save_text, save_yaml
+from ratelimit import RateLimitDecorator, sleep_and_retry
+
+from . import CACHE_TTL, identity
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT = {"calls": 1, "period": 0.1}
+MAX_WORKERS = 20
+
+
+class FastJsonDownload(Download):
+    def get_json(self):
+        try:
+            return orjson.loads(self.response.content)
+        except orjson.JSONDecodeError:  # eg. not UTF-8 encoded
+            return super().get_json()
+
+
+def clone_reader(reader, limiter=None):
+    # Download keeps the last response on the object so each concurrent request
+    # needs its own one, sharing the session (and hence any auth) of the reader
+    downloader = FastJsonDownload(session=reader.downloader.session)
+    if limiter is not None:
+        downloader.setup = sleep_and_retry(limiter(downloader.normal_setup))
+    clone = reader.clone(downloader)
+    clone.limiter = limiter
+    return clone
+
+
+def download_jsons(reader, urls, max_workers=MAX_WORKERS):
+    # readers cloned by ThreadLocalReaders carry the limiter of the reader they
+    # came from so requests made here count towards the same limit
+    limiter = getattr(reader, "limiter", None)
+    if limiter is None:
+        limiter = RateLimitDecorator(**RATE_LIMIT)
+
+    def download_json(url):
+        return clone_reader(reader, limiter).download_json(url)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(download_json, urls))
+
+
+class ThreadLocalReaders(dict):
+    # Gives each thread its own clone of a reader so that scrapers running
+    # concurrently do not share downloader responses or filename prefixes
+    def __init__(self, readers):
+        super().__init__(readers)
+        self.local = local()
+        self.limiters = {name: RateLimitDecorator(**RATE_LIMIT) for name in readers}
+
+    def __getitem__(self, name):
+        readers = getattr(self.local, "readers", None)
+        if readers is None:
+            readers = self.local.readers = dict()
+        reader = readers.get(name)
+        if reader is None:
+            reader = clone_reader(super().__getitem__(name), self.limiters[name])
+            readers[name] = reader
+        return reader
+
+    def get(self, name, default=None):
+        if name in self:
+            return self[name]
+        return default
+
+
+def save_dataset(dataset, path):
+    if dataset is None:
+        save_json(None, path)
+    else:
+        dataset.save_to_json(path, follow_urls=True)
+
+
+class CachedRead(Read):
+    # Downloads are saved and reused while younger than cache_ttl. That choice is
+    # made for each download, so the save and use_saved flags of Read stay off,
+    # and downloads only replace saved files once they are complete
+    def __init__(self, *args, cache_ttl=CACHE_TTL, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_ttl = cache_ttl
+
+    @staticmethod
+    def check_flags(saved_dir, save, use_saved, delete):
+        if save or use_saved:
+            raise ValueError(
+                "CachedRead decides itself when to save and use saved data!"
+            )
+        makedirs(saved_dir, exist_ok=True)
+
+    @classmethod
+    def create_readers(cls, *args, cache_ttl=CACHE_TTL, **kwargs):
+        super().create_readers(*args, **kwargs)
+        for reader in cls.retrievers.values():
+            reader.cache_ttl = cache_ttl
+
+    @classmethod
+    def generate_retrievers(cls, *args, **kwargs):
+        super().generate_retrievers(*args, **kwargs)
+        # scrapers look up readers on Read
+        Read.retrievers = cls.retrievers
+
+    def clone(self, downloader):
+        return CachedRead(
+            downloader,
+            fallback_dir=self.fallback_dir,
+            saved_dir=self.saved_dir,
+            temp_dir=self.temp_dir,
+            save=self.save,
+            use_saved=self.use_saved,
+            prefix=self.prefix,
+            delete=False,
+            today=self.today,
+            cache_ttl=self.cache_ttl,
+        )
+
+    def is_fresh(self, saved_path):
+        try:
+            return time() - getmtime(saved_path) < self.cache_ttl
+        except OSError:  # not saved yet
+            return False
+
+    @staticmethod
+    def save_complete(save_function, data, saved_path):
+        # written under a temporary name first so that an interrupted save is
+        # never mistaken for a complete one
+        fd, temp_path = mkstemp(suffix=".part", dir=dirname(saved_path))
+        close(fd)
+        try:
+            save_function(data, temp_path)
+            replace(temp_path, saved_path)
+        finally:
+            if exists(temp_path):
+                remove(temp_path)
+
+    def use_fallback(self, filename, logstr, load):
+        # the fallback is not saved so that it is never reused as fresh data
+        fallback_path = join(self.fallback_dir, filename)
+        logger.exception(
+            f"{logstr} download failed, using static data {fallback_path}!"
+        )
+        return load(fallback_path)
+
+    def retrieve(self, filename, logstr, fallback, load, download, save):
+        if not logstr:
+            logstr = filename
+        saved_path = join(self.saved_dir, filename)
+        if self.is_fresh(saved_path):
+            logger.info(f"Using saved {logstr} in {saved_path}")
+            return load(saved_path)
+        try:
+            data = download()
+        except DownloadError:
+            if not fallback:
+                raise
+            return self.use_fallback(filename, logstr, load)
+        self.save_complete(save, data, saved_path)
+        return data
+
+    def download_file(self, url, filename=None, logstr=None, fallback=False, **kwargs):
+        saved_filename, _ = self.get_filename(url, filename, **kwargs)
+        if not logstr:
+            logstr = saved_filename
+        saved_path = join(self.saved_dir, saved_filename)
+        if self.is_fresh(saved_path):
+            logger.info(f"Using saved {logstr} in {saved_path}")
+            return saved_path
+        try:
+            # with save off this downloads into temp_dir
+            path = super().download_file(url, filename, logstr, **kwargs)
+        except DownloadError:
+            if not fallback:
+                raise
+            return self.use_fallback(saved_filename, logstr, identity)
+        self.save_complete(move, path, saved_path)
+        return saved_path
+
+    def download_text(self, url, filename=None, logstr=None, fallback=False, **kwargs):
+        saved_filename, _ = self.get_filename(url, filename, **kwargs)
+        return self.retrieve(
+            saved_filename,
+            logstr,
+            fallback,
+            load_text,
+            lambda: super(CachedRead, self).download_text(
+                url, filename, logstr, **kwargs
+            ),
+            save_text,
+        )
+
+    def download_yaml(self, url, filename=None, logstr=None, fallback=False, **kwargs):
+        saved_filename, _ = self.get_filename(url, filename, ("yaml", "yml"), **kwargs)
+        return self.retrieve(
+            saved_filename,
+            logstr,
+            fallback,
+            load_yaml,
+            lambda: super(CachedRead, self).download_yaml(
+                url, filename, logstr, **kwargs
+            ),
+            save_yaml,
+        )
+
+    def download_json(self, url, filename=None, logstr=None, fallback=False, **kwargs):
+        saved_filename, _ = self.get_filename(url, filename, ("json",), **kwargs)
+        return self.retrieve(
+            saved_filename,
+            logstr,
+            fallback,
+            load_json,
+            lambda: super(CachedRead, self).download_json(
+                url, filename, logstr, **kwargs
+            ),
+            save_json,
+        )
+
+    def read_dataset(self, dataset_name):
+        return self.retrieve(
+            f"{dataset_name}.json",
+            f"dataset {dataset_name}",
+            False,
+            Dataset.load_from_json,
+            lambda: super(CachedRead, self).read_dataset(dataset_name),
+            save_dataset,
+        )
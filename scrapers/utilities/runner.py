@@ -0,0 +1,62 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from hdx.scraper.configurable.aggregator import Aggregator
+from hdx.scraper.runner import Runner
+from hdx.scraper.utilities.reader import Read
+
+from .reader import ThreadLocalReaders
+
+MAX_WORKERS = 16
+
+
+class ConcurrentRunner(Runner):
+    def __init__(self, *args, max_workers=MAX_WORKERS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_workers = max_workers
+
+    def group_scrapers(self, what_to_run, prioritise_scrapers):
+        first = list()
+        independent = list()
+        aggregators = list()
+        for name in self.scraper_names:
+            if what_to_run and name not in what_to_run:
+                continue
+            if name in prioritise_scrapers:
+                first.append(name)
+            elif isinstance(self.get_scraper(name), Aggregator):
+                # aggregators read the output of other scrapers
+                aggregators.append(name)
+            else:
+                independent.append(name)
+        return first, independent, aggregators
+
+    def run(self, what_to_run=None, force_run=False, prioritise_scrapers=None):
+        if prioritise_scrapers:
+            self.prioritise_scrapers(prioritise_scrapers)
+        else:
+            prioritise_scrapers = tuple()
+        first, independent, aggregators = self.group_scrapers(
+            what_to_run, prioritise_scrapers
+        )
+        for name in first:
+            self.run_scraper(name, force_run)
+        readers = Read.retrievers
+        Read.retrievers = ThreadLocalReaders(readers)
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(self.run_scraper, name, force_run)
+                    for name in independent
+                ]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    # stop at the first failure like Runner.run rather than
+                    # waiting for the scrapers that have not started yet
+                    executor.shutdown(cancel_futures=True)
+                    raise
+        finally:
+            Read.retrievers = readers
+        for name in aggregators:
+            self.run_scraper(name, force_run)
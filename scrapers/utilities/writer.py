@@ -0,0 +1,88 @@
+from functools import lru_cache
+
+from hdx.location.country import Country
+from hdx.scraper.utilities.writer import Writer
+
+from . import identity
+
+# regional rows from get_regional_rows start with the regional headers so the
+# region name is always here
+REGION_NAME_INDEX = Writer.regional_headers[1].index("#region+name")
+
+
+class FastWriter(Writer):
+    def update_toplevel(
+        self,
+        toplevel_rows,
+        tab="allregions",
+        regional_rows=None,
+        regional_adm="ALL",
+        regional_hxltags=None,
+        regional_first=False,
+    ):
+        if not toplevel_rows:
+            toplevel_rows = [[], [], []]
+        if regional_rows:
+            headers, hxltags = regional_rows[0], regional_rows[1]
+            # There is one row per region so stop at the first match and pick
+            # out the wanted columns once
+            regional_row = next(
+                (
+                    row
+                    for row in regional_rows[2:]
+                    if row[REGION_NAME_INDEX] == regional_adm
+                ),
+                None,
+            )
+            if regional_row is None:
+                indices = []
+            else:
+                indices = [
+                    i
+                    for i, hxltag in enumerate(hxltags)
+                    if i != REGION_NAME_INDEX
+                    and (not regional_hxltags or hxltag in regional_hxltags)
+                ]
+            rows_to_insert = (
+                [headers[i] for i in indices],
+                [hxltags[i] for i in indices],
+                [regional_row[i] for i in indices],
+            )
+            for i, row_to_insert in enumerate(rows_to_insert):
+                if regional_first:
+                    toplevel_rows[i] = row_to_insert + toplevel_rows[i]
+                else:
+                    toplevel_rows[i] += row_to_insert
+        self.update(tab, toplevel_rows)
+
+    def update_subnational(
+        self, adminlevel, names=None, level="subnational", tab="subnational"
+    ):
+        # Look up the iso3, country name and admin name once per pcode rather
+        # than for every column that needs them, and each country name once
+        get_country_name = lru_cache(maxsize=None)(Country.get_country_name_from_iso3)
+        pcodes = adminlevel.pcodes
+        pcode_to_iso3 = adminlevel.pcode_to_iso3
+        pcode_to_name = adminlevel.pcode_to_name
+        columns = dict()
+        for pcode in pcodes:
+            countryiso3 = pcode_to_iso3[pcode]
+            columns[pcode] = (
+                countryiso3,
+                get_country_name(countryiso3),
+                pcode_to_name[pcode],
+            )
+        fns = (
+            lambda adm: columns[adm][0],
+            lambda adm: columns[adm][1],
+            identity,
+            lambda adm: columns[adm][2],
+        )
+        rows = self.runner.get_rows(
+            level,
+            pcodes,
+            self.subnational_headers[adminlevel.admin_level],
+            fns,
+            names=names,
+        )
+        self.update(tab, rows)
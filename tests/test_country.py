@@ -0,0 +1,98 @@
+from os import listdir, utime
+from os.path import join
+from time import time
+
+import hxl
+import pytest
+from hdx.location.country import Country
+from hdx.utilities.path import script_dir_plus_file
+from hxl import InputOptions
+from scrapers.utilities.country import load_countriesdata
+
+
+class TestLoadCountriesData:
+    overrides = {"PSE": "oPt"}
+    mappings = {"Turkiye": "TUR"}
+
+    @pytest.fixture(scope="function", autouse=True)
+    def country_state(self):
+        state = (
+            Country._countriesdata,
+            Country._country_name_overrides,
+            Country._country_name_mappings,
+        )
+        Country._countriesdata = None
+        yield
+        (
+            Country._countriesdata,
+            Country._country_name_overrides,
+            Country._country_name_mappings,
+        ) = state
+
+    @pytest.fixture(scope="function")
+    def live_downloads(self, monkeypatch):
+        data = hxl.data
+        path = script_dir_plus_file(
+            "Countries & Territories Taxonomy MVP - C&T Taxonomy with HXL Tags.csv",
+            Country,
+        )
+        live_downloads = {"urls": list(), "fail": False}
+
+        def live_data(url, input_options):
+            if url != Country._ochaurl:  # the file packaged with Country
+                return data(url, input_options)
+            live_downloads["urls"].append(url)
+            if live_downloads["fail"]:
+                raise OSError("Download failed!")
+            return data(path, InputOptions(allow_local=True, encoding="utf-8"))
+
+        monkeypatch.setattr(hxl, "data", live_data)
+        return live_downloads
+
+    def load(self, cache_dir):
+        Country._countriesdata = None
+        return load_countriesdata(
+            True, self.overrides, self.mappings, cache_dir=str(cache_dir)
+        )
+
+    def test_miss_then_hit(self, tmp_path, live_downloads):
+        countriesdata = self.load(tmp_path)
+        assert len(live_downloads["urls"]) == 1
+        assert Country.get_country_name_from_iso3("PSE") == "oPt"
+        assert len(listdir(tmp_path)) == 1
+        live_downloads["fail"] = True
+        assert self.load(tmp_path) == countriesdata
+        assert len(live_downloads["urls"]) == 1
+        assert Country.get_iso3_country_code("Turkiye") == "TUR"
+
+    def test_expired(self, tmp_path, live_downloads):
+        self.load(tmp_path)
+        path = join(tmp_path, listdir(tmp_path)[0])
+        two_days_ago = time() - 2 * 86400
+        utime(path, (two_days_ago, two_days_ago))
+        self.load(tmp_path)
+        assert len(live_downloads["urls"]) == 2
+        assert time() - tmp_path.joinpath(listdir(tmp_path)[0]).stat().st_mtime < 60
+
+    def test_corrupt(self, tmp_path, live_downloads):
+        countriesdata = self.load(tmp_path)
+        path = join(tmp_path, listdir(tmp_path)[0])
+        with open(path, "wb") as f:
+            f.write(b"\x80\x04truncated")
+        assert self.load(tmp_path) == countriesdata
+        assert len(live_downloads["urls"]) == 2
+        live_downloads["fail"] = True
+        assert self.load(tmp_path) == countriesdata
+        assert len(live_downloads["urls"]) == 2
+
+    def test_live_failure_not_cached(self, tmp_path, live_downloads):
+        live_downloads["fail"] = True
+        countriesdata = self.load(tmp_path)
+        assert countriesdata["countries"]
+        assert Country.get_country_name_from_iso3("PSE") == "oPt"
+        assert listdir(tmp_path) == []
+
+    def test_unwritable_cache_dir(self, tmp_path, live_downloads):
+        cache_dir = tmp_path / "file"
+        cache_dir.write_text("not a directory")
+        assert self.load(cache_dir)["countries"]
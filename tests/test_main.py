@@ -1,20 +1,27 @@
-import filecmp
+from datetime import date, datetime
 from os.path import join
+from shutil import copyfile, copytree
 
 import pytest
 from hdx.api.configuration import Configuration
+from hdx.location.country import Country
 from hdx.scraper.outputs.base import BaseOutput
-from hdx.scraper.outputs.json import JsonFile
+from hdx.scraper.outputs.excelfile import ExcelFile
 from hdx.scraper.utilities.reader import Read
 from hdx.utilities.dateparse import parse_date
 from hdx.utilities.errors_onexit import ErrorsOnExit
+from hdx.utilities.loader import load_json
 from hdx.utilities.path import temp_dir
 from hdx.utilities.useragent import UserAgent
+from openpyxl import load_workbook
+from pandas import DataFrame
 from scrapers.main import get_indicators
+from scrapers.utilities.outputs import FastJsonFile, StreamingExcelFile
+from scrapers.utilities.reader import CachedRead
 
 
 class TestArabLeague:
-    @pytest.fixture(scope="function")
+    @pytest.fixture(scope="session")
     def configuration(self):
         UserAgent.set_global("test")
         Configuration._create(
@@ -24,40 +31,116 @@ class TestArabLeague:
         )
         return Configuration.read()
 
-    @pytest.fixture(scope="function")
+    @pytest.fixture(scope="session")
     def folder(self):
         return join("tests", "fixtures")
 
-    def test_get_indicators(self, configuration, folder):
+    @pytest.fixture(scope="session", autouse=True)
+    def countriesdata(self, configuration):
+        Country.countriesdata(
+            use_live=False,
+            country_name_overrides=configuration["country_name_overrides"],
+            country_name_mappings=configuration["country_name_mappings"],
+        )
+
+    def check_get_indicators(self, configuration, folder, temp_folder):
         with ErrorsOnExit() as errors_on_exit:
-            with temp_dir(
-                "TestArabLeagueViz", delete_on_success=True, delete_on_failure=False
-            ) as temp_folder:
-                today = parse_date("2022-05-02")
-                Read.create_readers(
-                    temp_folder,
-                    join(folder, "input"),
-                    temp_folder,
-                    save=False,
-                    use_saved=True,
-                    today=today,
-                )
-                tabs = configuration["tabs"]
-                noout = BaseOutput(tabs)
-                jsonout = JsonFile(configuration["json"], tabs)
-                outputs = {"gsheets": noout, "excel": noout, "json": jsonout}
-                countries_to_save = get_indicators(
-                    configuration,
-                    today,
-                    outputs,
-                    tabs,
-                    scrapers_to_run=None,
-                    countries_override=None,
-                    errors_on_exit=errors_on_exit,
-                    use_live=False,
-                )
-                filepaths = jsonout.save(
-                    folder=temp_folder, countries_to_save=countries_to_save
-                )
-                filename = configuration["json"]["output"]
-                assert filecmp.cmp(filepaths[0], join(folder, filename))
+            tabs = configuration["tabs"]
+            noout = BaseOutput(tabs)
+            excel_path = join(temp_folder, "all.xlsx")
+            excelout = StreamingExcelFile(excel_path, tabs, tabs)
+            reference_path = join(temp_folder, "reference.xlsx")
+            referenceout = ExcelFile(reference_path, tabs, tabs)
+            jsonout = FastJsonFile(configuration["json"], tabs)
+            outputs = {
+                "gsheets": noout,
+                "excel": excelout,
+                "excel_reference": referenceout,
+                "json": jsonout,
+            }
+            countries_to_save = get_indicators(
+                configuration,
+                parse_date("2022-05-02"),
+                outputs,
+                tabs,
+                scrapers_to_run=None,
+                countries_override=None,
+                errors_on_exit=errors_on_exit,
+                use_live=False,
+            )
+            filepaths = jsonout.save(
+                folder=temp_folder, countries_to_save=countries_to_save
+            )
+            filename = configuration["json"]["output"]
+            assert load_json(filepaths[0]) == load_json(join(folder, filename))
+            excelout.save()
+            referenceout.save()
+            self.check_excel(excel_path, reference_path)
+
+    def test_streaming_excel_file(self, tmp_path):
+        tabs = {"national": "national", "regional": "regional", "other": "other"}
+        updatetabs = ("national", "regional")
+        excel_path = str(tmp_path / "streamed.xlsx")
+        reference_path = str(tmp_path / "reference.xlsx")
+        outputs = (
+            StreamingExcelFile(excel_path, tabs, updatetabs),
+            ExcelFile(reference_path, tabs, updatetabs),
+        )
+        rows = [
+            ["name", "date", "time", "value", "empty"],
+            ["#country+name", "#date", "#date+time", "#value", "#meta"],
+            ["Yemen", date(2022, 5, 2), datetime(2022, 5, 2, 13, 30), 1.5, None],
+            ["Libya", date(2021, 1, 1), datetime(2021, 1, 1), 2, ""],
+        ]
+        df = DataFrame(
+            {"name": ["Syria"], "date": [datetime(2022, 5, 2)], "value": [3]}
+        )
+        for output in outputs:
+            output.update_tab("regional", [["old"]])
+            output.update_tab("national", rows)
+            output.update_tab("regional", df, {"name": "#region+name"})
+            output.update_tab("other", rows)
+            output.save()
+        self.check_excel(excel_path, reference_path)
+        assert load_workbook(excel_path)["national"]["B3"].is_date
+
+    @staticmethod
+    def check_excel(excel_path, reference_path):
+        workbook = load_workbook(excel_path)
+        reference = load_workbook(reference_path)
+        # openpyxl starts workbooks with an empty sheet that xlsxwriter does not
+        del reference["Sheet"]
+        assert workbook.sheetnames == reference.sheetnames
+        for sheetname in reference.sheetnames:
+            assert list(workbook[sheetname].values) == list(reference[sheetname].values)
+
+    def test_get_indicators(self, configuration, folder):
+        with temp_dir(
+            "TestArabLeagueViz", delete_on_success=True, delete_on_failure=False
+        ) as temp_folder:
+            Read.create_readers(
+                temp_folder,
+                join(folder, "input"),
+                temp_folder,
+                save=False,
+                use_saved=True,
+                today=parse_date("2022-05-02"),
+            )
+            self.check_get_indicators(configuration, folder, temp_folder)
+
+    def test_get_indicators_cached(self, configuration, folder, tmp_path):
+        with temp_dir(
+            "TestArabLeagueVizCached", delete_on_success=True, delete_on_failure=False
+        ) as temp_folder:
+            # copied without metadata so the saved data is freshly modified, and
+            # under tmp_path so a failed run cannot leave it behind for the next
+            saved_folder = str(tmp_path / "saved_data")
+            copytree(join(folder, "input"), saved_folder, copy_function=copyfile)
+            CachedRead.create_readers(
+                temp_folder,
+                saved_folder,
+                temp_folder,
+                today=parse_date("2022-05-02"),
+                cache_ttl=3600,
+            )
+            self.check_get_indicators(configuration, folder, temp_folder)
@@ -0,0 +1,87 @@
+from os import listdir, utime
+from os.path import join
+from time import time
+
+import pytest
+from hdx.utilities.base_downloader import DownloadError
+from hdx.utilities.loader import load_json, load_text
+from hdx.utilities.saver import save_json, save_text
+from scrapers.utilities.reader import CachedRead
+
+
+class FakeDownload:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.urls = list()
+
+    def download_json(self, url, **kwargs):
+        self.urls.append(url)
+        if self.fail:
+            raise DownloadError(f"Download of {url} failed!")
+        return {"downloaded": True}
+
+    def download_file(self, url, path, **kwargs):
+        self.urls.append(url)
+        if self.fail:
+            raise DownloadError(f"Download of {url} failed!")
+        save_text("downloaded", path)
+        return path
+
+
+class TestCachedRead:
+    url = "https://example.com/data.json"
+
+    @pytest.fixture(scope="function")
+    def folders(self, tmp_path):
+        folders = list()
+        for name in ("fallback", "saved", "temp"):
+            folder = tmp_path / name
+            folder.mkdir()
+            folders.append(str(folder))
+        save_json({"fallback": True}, join(folders[0], "data.json"))
+        save_text("fallback", join(folders[0], "data.txt"))
+        return folders
+
+    def test_check_flags(self, folders):
+        with pytest.raises(ValueError):
+            CachedRead(FakeDownload(), *folders, save=True)
+        with pytest.raises(ValueError):
+            CachedRead(FakeDownload(), *folders, use_saved=True)
+
+    def test_fresh(self, folders):
+        saved_path = join(folders[1], "data.json")
+        save_json({"saved": True}, saved_path)
+        downloader = FakeDownload()
+        reader = CachedRead(downloader, *folders, cache_ttl=3600)
+        assert reader.download_json(self.url) == {"saved": True}
+        assert downloader.urls == []
+        assert reader.clone(downloader).cache_ttl == 3600
+
+    def test_stale(self, folders):
+        saved_path = join(folders[1], "data.json")
+        save_json({"saved": True}, saved_path)
+        two_hours_ago = time() - 7200
+        utime(saved_path, (two_hours_ago, two_hours_ago))
+        downloader = FakeDownload()
+        reader = CachedRead(downloader, *folders, cache_ttl=3600)
+        assert reader.download_json(self.url) == {"downloaded": True}
+        assert downloader.urls == [self.url]
+        assert load_json(saved_path) == {"downloaded": True}
+        assert listdir(folders[1]) == ["data.json"]
+
+    def test_download_file(self, folders):
+        reader = CachedRead(FakeDownload(), *folders)
+        url = "https://example.com/data.txt"
+        path = reader.download_file(url)
+        assert path == join(folders[1], "data.txt")
+        assert load_text(path) == "downloaded"
+        assert listdir(folders[2]) == []
+
+    def test_fallback(self, folders):
+        reader = CachedRead(FakeDownload(fail=True), *folders)
+        with pytest.raises(DownloadError):
+            reader.download_json(self.url)
+        assert reader.download_json(self.url, fallback=True) == {"fallback": True}
+        path = reader.download_file("https://example.com/data.txt", fallback=True)
+        assert path == join(folders[0], "data.txt")
+        assert listdir(folders[1]) == []
@@ -0,0 +1,57 @@
+from threading import Lock
+from time import sleep
+
+import pytest
+from hdx.scraper.configurable.aggregator import Aggregator
+from hdx.scraper.utilities.reader import Read
+from scrapers.utilities.runner import ConcurrentRunner
+
+
+class RecordingRunner(ConcurrentRunner):
+    def __init__(self, names, aggregators=tuple(), failing=tuple(), **kwargs):
+        super().__init__(("AFG",), **kwargs)
+        self.failing = failing
+        self.lock = Lock()
+        self.ran = list()
+        for name in names:
+            if name in aggregators:
+                scraper = Aggregator.__new__(Aggregator)
+            else:
+                scraper = object()
+            self.scrapers[name] = scraper
+            self.scraper_names.append(name)
+
+    def run_scraper(self, name, force_run=False):
+        if name in self.failing:
+            raise ValueError(f"{name} failed!")
+        sleep(0.1)
+        with self.lock:
+            self.ran.append(name)
+        return True
+
+
+class TestConcurrentRunner:
+    def test_run_order(self):
+        runner = RecordingRunner(
+            ("a", "aggregate_1", "population", "b", "c", "aggregate_2", "d"),
+            aggregators=("aggregate_1", "aggregate_2"),
+        )
+        readers = Read.retrievers
+        runner.run(prioritise_scrapers=("population", "d"))
+        assert runner.ran[:2] == ["population", "d"]
+        assert sorted(runner.ran[2:5]) == ["a", "b", "c"]
+        assert runner.ran[5:] == ["aggregate_1", "aggregate_2"]
+        assert Read.retrievers is readers
+
+    def test_run_fails_fast(self):
+        runner = RecordingRunner(
+            ("bad", "a", "b", "c", "aggregate"),
+            aggregators=("aggregate",),
+            failing=("bad",),
+            max_workers=1,
+        )
+        readers = Read.retrievers
+        with pytest.raises(ValueError):
+            runner.run()
+        assert len(runner.ran) <= 1
+        assert Read.retrievers is readers